@@ -5,20 +5,37 @@ Syncs MCP servers between mcpServers.json and ~/.claude.json
 """
 
 import argparse
+import fnmatch
+import functools
+import hashlib
+import itertools
 import json
 import os
+import shutil
 import signal
-import subprocess
 import sys
-import urllib.error
-import urllib.request
-from datetime import datetime, timezone
+import time
+from collections.abc import Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from stat import S_IMODE
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import questionary
-from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
-from questionary import Choice
+# questionary, prompt_toolkit, urllib, subprocess, tempfile and concurrent.futures are imported
+# where they are used, keeping them off the startup path of --help, --clean listings and early error exits
+if TYPE_CHECKING:
+    from questionary import Choice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 def signal_handler(sig, frame):
@@ -31,17 +48,101 @@ def signal_handler(sig, frame):
 signal.signal(signal.SIGINT, signal_handler)
 
 
+# URL responses larger than this are stream-parsed with ijson when it is installed
+_STREAM_PARSE_MIN_BYTES = 1024 * 1024
+
+
+def _url_cache_path(url: str) -> Path:
+    """Return the on-disk cache file used for a URL."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "mcp-sync-config" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _read_url_cache(cache_path: Path, url: str) -> dict[str, Any] | None:
+    """Read a cached URL response, ignoring missing, corrupt or mismatched entries."""
+    try:
+        with cache_path.open("rb") as f:
+            cached = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("url") != url or "data" not in cached:
+        return None
+    return cached
+
+
+def _write_url_cache(cache_path: Path, url: str, headers: Any, data: dict[str, Any]) -> None:
+    """Cache a URL response with its validators; failures only cost the next run a full fetch.
+
+    Server configs can carry API keys in env, so the cache is private to the user (0700
+    directory, 0600 files) and replaced atomically, never left truncated.
+    """
+    import tempfile
+
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    # Written compactly: nobody reads the cache by hand, and indenting large catalogs multiplies their size
+    content = _dumps({"url": url, "etag": etag, "last_modified": last_modified, "data": data}, indent=False)
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0600
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
 def load_json_from_url(url: str) -> dict[str, Any]:
-    """Load and parse JSON from a URL."""
+    """Load and parse JSON from a URL.
+
+    The last response is cached on disk together with its ETag/Last-Modified headers
+    and revalidated with a conditional GET, so an unchanged file is not downloaded again.
+    """
+    import urllib.error
+    import urllib.request
+
+    cache_path = _url_cache_path(url)
+    cached = _read_url_cache(cache_path, url)
+    request = urllib.request.Request(url)
+    if cached is not None:
+        if cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        if cached.get("last_modified"):
+            request.add_header("If-Modified-Since", cached["last_modified"])
+
     try:
         print(f"Fetching MCP servers from URL: {url}")
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = response.read()
-            return json.loads(data.decode("utf-8"))
+        with urllib.request.urlopen(request, timeout=10) as response:
+            if ijson is not None and int(response.headers.get("Content-Length") or 0) > _STREAM_PARSE_MIN_BYTES:
+                # Parse large catalogs incrementally instead of buffering the whole body first
+                try:
+                    result = next(ijson.items(response, "", use_float=True))
+                except ijson.JSONError as e:
+                    print(f"Error: Invalid JSON from URL: {e}")
+                    sys.exit(1)
+            else:
+                result = _loads(response.read())
+            if not isinstance(result, dict):
+                print("Error: Invalid JSON from URL: expected an object of MCP servers")
+                sys.exit(1)
+            _write_url_cache(cache_path, url, response.headers, result)
+            return result
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            print("Not modified since last fetch, using cached copy")
+            return cached["data"]
+        print(f"Error fetching URL: {e}")
+        sys.exit(1)
     except urllib.error.URLError as e:
         print(f"Error fetching URL: {e}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         print(f"Error: Invalid JSON from URL: {e}")
         sys.exit(1)
     except Exception as e:
@@ -49,50 +150,201 @@ def load_json_from_url(url: str) -> dict[str, Any]:
         sys.exit(1)
 
 
-def load_json_file(filepath: Path, create_if_missing: bool = False) -> dict[str, Any]:
-    """Load and parse a JSON file."""
+def load_json_from_urls(urls: list[str]) -> dict[str, Any]:
+    """Load JSON from one or more URLs, fetching concurrently and merging with later URLs taking precedence."""
+    if len(urls) == 1:
+        return load_json_from_url(urls[0])
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(urls))) as executor:
+        results = list(executor.map(load_json_from_url, urls))
+
+    merged = {}
+    for servers in results:
+        merged.update(servers)
+    return merged
+
+
+# Parses kept by load_json_file(keep=True), keyed by path, with the (st_mtime_ns, st_size) they were parsed at
+_json_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed.
+
+    Input orjson rejects but the json module accepts (NaN, numbers out of double range)
+    is parsed with the json module instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes, indented unless indent is false, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits; the json module can write them
+            pass
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def load_json_file(filepath: Path, create_if_missing: bool = False, keep: bool = False) -> dict[str, Any]:
+    """Load and parse a JSON file, keeping the parse for the next load of the unchanged file if keep is set."""
     try:
-        with filepath.open() as f:
-            return json.load(f)
+        with filepath.open("rb") as f:
+            st = os.fstat(f.fileno())
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            # A kept parse is handed over once, so the next loader owns the dict and may modify it
+            cached = _json_cache.pop(filepath, None)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            data = _loads(f.read())
+        if keep:
+            _json_cache[filepath] = (fingerprint, data)
+        return data
     except FileNotFoundError:
         if create_if_missing:
             print(f"File not found: {filepath}")
             print(f"Creating empty {filepath.name}...")
-            with filepath.open("w") as f:
-                json.dump({}, f, indent=2)
+            with filepath.open("wb") as f:
+                f.write(_dumps({}))
             print(f"Created {filepath}")
             print("\nNote: The file is empty. Please add your MCP server configurations to this file.")
             print("See mcpServers.json.example for reference.")
             return {}
         print(f"Error: File not found: {filepath}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         print(f"Error: Invalid JSON in {filepath}: {e}")
         sys.exit(1)
 
 
-def save_json_file(filepath: Path, data: dict[str, Any], create_backup: bool = True) -> None:
-    """Save data to a JSON file, optionally creating a backup."""
-    if create_backup and filepath.exists():
-        backup_path = filepath.with_suffix(f".backup.{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json")
-        with backup_path.open("w") as f:
-            json.dump(load_json_file(filepath), f, indent=2)
-        print(f"Created backup: {backup_path}")
+def _create_backup(filepath: Path) -> Path:
+    """Keep the current content of filepath under a timestamped backup name and return it.
 
-    with filepath.open("w") as f:
-        json.dump(data, f, indent=2)
+    Backups made within the same second get a numeric suffix instead of overwriting each other.
+    """
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    for counter in itertools.count():
+        stamp = f"{timestamp}_{counter}" if counter else timestamp
+        backup_path = filepath.with_suffix(f".backup.{stamp}.json")
+        try:
+            # The old inode survives the replace in save_json_file, so linking it is a zero-copy backup
+            os.link(filepath, backup_path)
+        except FileExistsError:
+            continue
+        except OSError:
+            try:
+                with filepath.open("rb") as src:
+                    # Create the copy with the original's mode so a private file never becomes readable
+                    mode = S_IMODE(os.fstat(src.fileno()).st_mode)
+                    fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+                    with os.fdopen(fd, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+            except FileExistsError:
+                continue
+        return backup_path
+
+
+def save_json_file(filepath: Path, data: dict[str, Any], create_backup: bool = True) -> Path | None:
+    """Save data to a JSON file, optionally creating a backup, and return the backup path (None if none was made)."""
+    import tempfile
+
+    # Write to a temporary file and move it into place, so an interrupted save never leaves a truncated file
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=f"{filepath.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    backup_path = None
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            previous_mode = filepath.stat().st_mode
+        except FileNotFoundError:
+            previous_mode = None
+
+        if previous_mode is not None:
+            # Keep the original permissions; .claude.json may hold credentials
+            os.chmod(tmp_path, S_IMODE(previous_mode))
+
+            if create_backup:
+                # A hard link to the previous file where supported, a copy otherwise
+                backup_path = _create_backup(filepath)
+                print(f"Created backup: {backup_path}")
+
+        _json_cache.pop(filepath, None)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     print(f"Updated: {filepath}")
+    return backup_path
 
 
-def get_current_mcp_servers(claude_config: dict[str, Any], project_path: str | None = None) -> dict[str, Any]:
-    """Get current MCP servers configuration for global or specific project."""
+def _new_project_entry() -> dict[str, Any]:
+    """Return the settings Claude Code expects on a newly created project entry.
+
+    A fresh dict with fresh containers is built on every call, so project entries never share lists.
+    """
+    return {
+        "allowedTools": [],
+        "history": [],
+        "mcpContextUris": [],
+        "mcpServers": {},
+        "enabledMcpjsonServers": [],
+        "disabledMcpjsonServers": [],
+        "hasTrustDialogAccepted": False,
+        "projectOnboardingSeenCount": 0,
+        "hasClaudeMdExternalIncludesApproved": False,
+        "hasClaudeMdExternalIncludesWarningShown": False,
+    }
+
+
+def get_current_mcp_servers(claude_config: dict[str, Any], project_path: str | None = None) -> Mapping[str, Any]:
+    """Get current MCP servers configuration for global or specific project.
+
+    The result is a read-only view of the section inside claude_config; use set_mcp_servers to change it.
+    """
     if project_path:
         projects = claude_config.get("projects", {})
         if project_path in projects:
-            return projects[project_path].get("mcpServers", {})
+            return MappingProxyType(projects[project_path].get("mcpServers", {}))
         # Create project entry if it doesn't exist
-        return {}
-    return claude_config.get("mcpServers", {})
+        return MappingProxyType({})
+    return MappingProxyType(claude_config.get("mcpServers", {}))
+
+
+def read_mcp_servers_streaming(claude_config_path: Path, project_path: str | None = None) -> Mapping[str, Any]:
+    """Read only the MCP servers section of .claude.json without loading the whole file.
+
+    Falls back to a full load when ijson is not installed or when the project path
+    contains a dot, which ijson cannot express in a prefix.
+    """
+    if ijson is None or (project_path and "." in project_path):
+        # run_sync loads the whole file again before saving, so keep this parse for it
+        return get_current_mcp_servers(load_json_file(claude_config_path, keep=True), project_path)
+
+    prefix = f"projects.{project_path}.mcpServers" if project_path else "mcpServers"
+    try:
+        with claude_config_path.open("rb") as f:
+            return dict(ijson.kvitems(f, prefix, use_float=True))
+    except FileNotFoundError:
+        print(f"Error: File not found: {claude_config_path}")
+        sys.exit(1)
+    except ijson.JSONError as e:
+        print(f"Error: Invalid JSON in {claude_config_path}: {e}")
+        sys.exit(1)
 
 
 def set_mcp_servers(
@@ -100,70 +352,103 @@ def set_mcp_servers(
 ) -> None:
     """Set MCP servers configuration for global or specific project."""
     if project_path:
-        if "projects" not in claude_config:
-            claude_config["projects"] = {}
-        if project_path not in claude_config["projects"]:
-            claude_config["projects"][project_path] = {
-                "allowedTools": [],
-                "history": [],
-                "mcpContextUris": [],
-                "mcpServers": {},
-                "enabledMcpjsonServers": [],
-                "disabledMcpjsonServers": [],
-                "hasTrustDialogAccepted": False,
-                "projectOnboardingSeenCount": 0,
-                "hasClaudeMdExternalIncludesApproved": False,
-                "hasClaudeMdExternalIncludesWarningShown": False,
-            }
-        claude_config["projects"][project_path]["mcpServers"] = mcp_servers
+        projects = claude_config.setdefault("projects", {})
+        entry = projects.get(project_path)
+        if entry is None:
+            entry = projects[project_path] = _new_project_entry()
+        entry["mcpServers"] = mcp_servers
     else:
         claude_config["mcpServers"] = mcp_servers
 
 
-def create_server_choices(available_servers: dict[str, Any], current_servers: dict[str, Any]) -> list[Choice]:
-    """Create questionary choices for server selection."""
-    choices = []
-    for server_name, server_config in available_servers.items():
-        # Check if server is currently enabled
-        is_enabled = server_name in current_servers
+# Checkbox label details by server type: (caption, config key shown next to it)
+_TYPE_LABELS = {"sse": ("SSE", "url")}
+# Servers of other types are described by their command, if they have one
+_COMMAND_LABEL = ("Command", "command")
+
+
+def _server_label(server_name: str, server_config: dict[str, Any]) -> str:
+    """Build the descriptive checkbox label for a server."""
+    server_type = server_config.get("type")
+    # Malformed configs may hold an unhashable "type"; treat it like an unknown type
+    label = _TYPE_LABELS.get(server_type) if isinstance(server_type, str) else None
+    if label is None:
+        if "command" not in server_config:
+            return server_name
+        label = _COMMAND_LABEL
+    caption, key = label
+    return f"{server_name} ({caption}: {server_config.get(key, 'N/A')})"
+
+
+class _RawChoice(NamedTuple):
+    """A server menu entry before it is turned into a questionary Choice."""
+
+    title: str
+    value: str
+    checked: bool
+
+
+def _build_raw_choices(available_servers: dict[str, Any], enabled_names: frozenset[str]) -> list[_RawChoice]:
+    """Build the server menu entries, sorted by title."""
+    # The usual alphabetically ordered mcpServers.json needs no pre-check: list.sort finds the
+    # single sorted run in one C-level pass and sorts in place.
+    rows = [
+        _RawChoice(_server_label(name, config), name, name in enabled_names)
+        for name, config in available_servers.items()
+    ]
+    rows.sort(key=itemgetter(0))
+    return rows
 
-        # Create a descriptive label
-        if "type" in server_config and server_config["type"] == "sse":
-            label = f"{server_name} (SSE: {server_config.get('url', 'N/A')})"
-        elif "command" in server_config:
-            label = f"{server_name} (Command: {server_config.get('command', 'N/A')})"
-        else:
-            label = server_name
 
-        choices.append(Choice(title=label, value=server_name, checked=is_enabled))
+def create_server_choices(available_servers: dict[str, Any], enabled_names: frozenset[str]) -> "list[Choice]":
+    """Create questionary choices for server selection, checking those in enabled_names."""
+    from questionary import Choice
 
-    return sorted(choices, key=lambda x: x.title)
+    return [
+        Choice(title=row.title, value=row.value, checked=row.checked)
+        for row in _build_raw_choices(available_servers, enabled_names)
+    ]
 
 
 def sync_mcp_servers(available_servers: dict[str, Any], selected_names: list[str]) -> dict[str, Any]:
     """Create new MCP servers configuration based on selection."""
-    new_servers = {}
-    for name in selected_names:
-        if name in available_servers:
-            new_servers[name] = available_servers[name]
-    return new_servers
+    selected = set(selected_names)
+    # Keep the source file's order rather than the menu's; server configs are shared, not copied,
+    # so callers replace whole mcpServers sections instead of mutating them
+    return {name: config for name, config in available_servers.items() if name in selected}
+
+
+# Files up to this size are fingerprinted by content, larger ones by modification time and size
+_FINGERPRINT_MAX_BYTES = 10 * 1024 * 1024
+
+
+def _file_fingerprint(filepath: Path) -> bytes | tuple[int, int] | None:
+    """Fingerprint a file so that saving it without changes does not count as an edit."""
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    if stat.st_size > _FINGERPRINT_MAX_BYTES:
+        return (stat.st_mtime_ns, stat.st_size)
+    return hashlib.blake2b(filepath.read_bytes(), digest_size=16).digest()
 
 
 def edit_json_file(filepath: Path) -> bool:
-    """Open JSON file in editor and return True if file was modified."""
+    """Open JSON file in editor and return True if its content was modified."""
+    import subprocess
+
     # Get the editor from environment or use vi as default
     editor = os.environ.get("EDITOR", "vi")
 
-    # Get initial modification time
-    initial_mtime = filepath.stat().st_mtime if filepath.exists() else 0
+    # Fingerprint the file before editing
+    initial_fingerprint = _file_fingerprint(filepath)
 
     try:
         # Open the file in the editor
         subprocess.run([editor, str(filepath)], check=True)
 
         # Check if file was modified
-        final_mtime = filepath.stat().st_mtime if filepath.exists() else 0
-        return final_mtime != initial_mtime
+        return _file_fingerprint(filepath) != initial_fingerprint
     except subprocess.CalledProcessError:
         print(f"Error: Failed to open editor '{editor}'")
         return False
@@ -172,48 +457,175 @@ def edit_json_file(filepath: Path) -> bool:
         return False
 
 
+def parse_preset(preset: str, available_servers: dict[str, Any]) -> list[str]:
+    """Parse a comma-separated --preset value.
+
+    --preset applies without confirmation, so a typo or an empty value must not silently
+    disable servers: unknown names and an empty selection exit with an error instead.
+    """
+    selected = [name.strip() for name in preset.split(",") if name.strip()]
+    if not selected:
+        print("Error: --preset must name at least one server")
+        sys.exit(1)
+    unknown = [name for name in selected if name not in available_servers]
+    if unknown:
+        print(f"Error: Unknown server(s) in --preset: {', '.join(unknown)}")
+        sys.exit(1)
+    return selected
+
+
+def select_servers(
+    available_servers: dict[str, Any], current_names: frozenset[str], mcp_file_path: Path | None
+) -> tuple[dict[str, Any], list[str]]:
+    """Interactively select servers to enable.
+
+    Pressing 'e' opens mcp_file_path in the editor and reloads it, so the possibly
+    reloaded available servers are returned along with the selection. Pass None for
+    mcp_file_path when servers come from a URL, which disables editing.
+    """
+    import questionary
+    from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+
+    using_url = mcp_file_path is None
+
+    # 'e' leaves the prompt so the file can be opened in the editor; the bindings are built once
+    # and merged into each new prompt
+    edit_requested = False
+    kb = KeyBindings()
+
+    @kb.add("e", eager=True)
+    def _(event):
+        nonlocal edit_requested
+        edit_requested = True
+        event.app.exit(result=[])
+
+    # Main selection loop
+    choices_source = None
+    while True:
+        # Create interactive selection, rebuilding choices only after servers were reloaded
+        if available_servers is not choices_source:
+            choices = create_server_choices(available_servers, current_names)
+            choices_source = available_servers
+
+        # Build prompt message
+        prompt_message = "Select MCP servers to enable"
+
+        # Build instruction text with keyboard shortcuts
+        if using_url:
+            instruction_text = "(Use arrow keys to move, <space> to select, <a> to toggle, <i> to invert)"
+        else:
+            instruction_text = "(Use arrow keys to move, <space> to select, <e> to edit, <a> to toggle, <i> to invert)"
+
+        # Create checkbox prompt
+        question = questionary.checkbox(prompt_message, choices=choices, instruction=instruction_text)
+
+        # Reset the edit flag for this prompt
+        edit_requested = False
+
+        # Add our custom key bindings to the question's application
+        if not using_url:
+            # Merge our key bindings with the existing ones
+            question.application.key_bindings = merge_key_bindings([kb, question.application.key_bindings])
+
+        try:
+            selected = question.unsafe_ask()
+
+            # Check if edit was requested
+            if edit_requested and not using_url:
+                print("\nOpening mcpServers.json in editor...")
+                if edit_json_file(mcp_file_path):
+                    print("File modified. Reloading configurations...\n")
+                    # Reload the modified file
+                    available_servers = load_json_file(mcp_file_path)
+                    if not available_servers:
+                        print("\nNo MCP servers found after edit!")
+                        print("Please add server configurations to the file.")
+                        sys.exit(0)
+                else:
+                    print("No changes made to the file.\n")
+                continue  # Go back to selection
+
+        except (KeyboardInterrupt, EOFError, Exception):
+            print("\nOperation cancelled.")
+            sys.exit(0)
+
+        if selected is None:
+            print("\nOperation cancelled.")
+            sys.exit(0)
+
+        # Exit the loop if not editing
+        return available_servers, selected
+
+
 def clean_backup_files(claude_config_path: Path) -> None:
     """Clean up .claude.json backup files."""
     backup_dir = claude_config_path.parent
     backup_pattern = ".claude.backup.*.json"
     
-    # Find all backup files
-    backup_files = list(backup_dir.glob(backup_pattern))
-    
+    # Find all backup files in a single directory scan, keeping each entry's stat result
+    try:
+        with os.scandir(backup_dir) as it:
+            entries = [entry for entry in it if fnmatch.fnmatch(entry.name, backup_pattern)]
+    except FileNotFoundError:
+        entries = []
+
+    backup_files = []
+    for entry in entries:
+        try:
+            backup_files.append((entry, entry.stat()))
+        except OSError:
+            # Dangling symlink, or removed since the scan
+            continue
+
     if not backup_files:
         print("No backup files found.")
         return
-    
+
     # Sort by modification time (newest first)
-    backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    
+    backup_files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+
     print(f"Found {len(backup_files)} backup file(s):")
-    for backup_file in backup_files:
-        stat = backup_file.stat()
-        mod_time = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+    for backup_file, stat in backup_files:
+        mod_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime))
         size = f"{stat.st_size:,}" if stat.st_size < 1024 else f"{stat.st_size/1024:.1f}K"
         print(f"  {backup_file.name} ({size} bytes, {mod_time})")
     
     print()
     # Use questionary for confirmation
+    import questionary
+
     confirm = questionary.confirm(
         "Delete all backup files?",
         default=False
     ).ask()
     
     if confirm:
-        for backup_file in backup_files:
-            backup_file.unlink()
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Unlink concurrently (this mostly pays off on network filesystems) with the executor's default
+        # pool size for I/O-bound work, but no more threads than files
+        max_workers = min(len(backup_files), 32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(os.unlink, [backup_file.path for backup_file, _ in backup_files]))
         print(f"✓ Deleted {len(backup_files)} backup file(s)")
     else:
         print("Cancelled. No files deleted.")
 
 
-def main():
+@functools.cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; parse_args leaves it untouched, so it is reused."""
     parser = argparse.ArgumentParser(description="Sync MCP servers between mcpServers.json and ~/.claude.json")
     parser.add_argument("--project", "-p", type=str, help="Project path to update (defaults to global mcpServers)")
     parser.add_argument("--mcp-file", "-m", type=str, default="mcpServers.json", help="Path to mcpServers.json file")
-    parser.add_argument("--url", "-u", type=str, help="URL to fetch mcpServers.json from (overrides --mcp-file)")
+    parser.add_argument(
+        "--url",
+        "-u",
+        type=str,
+        nargs="+",
+        action="extend",
+        help="URL(s) to fetch mcpServers.json from (overrides --mcp-file); later URLs take precedence",
+    )
     parser.add_argument(
         "--edit", "-e", action="store_true", help="Edit mcpServers.json before syncing (not available with --url)"
     )
@@ -227,16 +639,37 @@ def main():
     parser.add_argument(
         "--clean", action="store_true", help="Clean up .claude.json backup files"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--preset",
+        type=str,
+        help="Comma-separated server names to enable, skipping the interactive prompt and confirmation",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Enable all available servers, skipping the interactive prompt and confirmation",
+    )
+    return parser
 
-    # Validate that --edit is not used with --url
-    if args.edit and args.url:
-        print("Error: --edit option cannot be used with --url")
-        sys.exit(1)
 
-    # Validate that --binding is not used with --url
+def validate_args(args: argparse.Namespace) -> str | None:
+    """Return an error message if incompatible options were combined, otherwise None."""
+    # --edit and --binding both write to mcpServers.json, which --url replaces
+    if args.edit and args.url:
+        return "--edit option cannot be used with --url"
     if args.binding and args.url:
-        print("Error: --binding option cannot be used with --url")
+        return "--binding option cannot be used with --url"
+    if args.preset is not None and args.all:
+        return "--preset option cannot be used with --all"
+    return None
+
+
+def main():
+    args = build_parser().parse_args()
+
+    error = validate_args(args)
+    if error:
+        print(f"Error: {error}")
         sys.exit(1)
 
     try:
@@ -273,18 +706,14 @@ def run_sync(args):
 
     # Load MCP servers from URL or file
     if using_url:
-        available_servers = load_json_from_url(args.url)
+        available_servers = load_json_from_urls(args.url)
     else:
         available_servers = load_json_file(mcp_file_path, create_if_missing=True)
 
-    # Load Claude configuration
-    claude_config = load_json_file(claude_config_path)
-
-    # Get current MCP servers from Claude config
-    current_servers = get_current_mcp_servers(claude_config, args.project)
-
     # Handle binding mode - update mcpServers.json with servers from .claude.json
+    current_servers = None
     if args.binding and not using_url:
+        current_servers = read_mcp_servers_streaming(claude_config_path, args.project)
         servers_to_add = {}
         for server_name, server_config in current_servers.items():
             if server_name not in available_servers:
@@ -310,7 +739,7 @@ def run_sync(args):
     # Check if no MCP servers are available
     if not available_servers:
         if args.url:
-            print(f"\nNo MCP servers found at URL: {args.url}")
+            print(f"\nNo MCP servers found at URL: {', '.join(args.url)}")
             print("Please ensure the URL returns a valid JSON with MCP server configurations.")
         else:
             print("\nNo MCP servers found in mcpServers.json!")
@@ -323,6 +752,11 @@ def run_sync(args):
             print("  }")
         sys.exit(0)
 
+    # Read only the current MCP servers, once we know there is something to select;
+    # the full Claude config is loaded just before saving
+    if current_servers is None:
+        current_servers = read_mcp_servers_streaming(claude_config_path, args.project)
+
     # Display target information
     if args.project:
         print(f"Syncing MCP servers for project: {args.project}")
@@ -333,100 +767,57 @@ def run_sync(args):
     print(f"Currently enabled: {len(current_servers)}")
     print()
 
-    # Main selection loop
-    while True:
-        # Create interactive selection
-        choices = create_server_choices(available_servers, current_servers)
+    # Names of the enabled servers, shared by the menu and the change summary
+    current_names = frozenset(current_servers)
 
-        # Build prompt message
-        prompt_message = "Select MCP servers to enable"
-
-        # Build instruction text with keyboard shortcuts
-        if using_url:
-            instruction_text = "(Use arrow keys to move, <space> to select, <a> to toggle, <i> to invert)"
-        else:
-            instruction_text = "(Use arrow keys to move, <space> to select, <e> to edit, <a> to toggle, <i> to invert)"
-
-        # Create checkbox prompt
-        question = questionary.checkbox(prompt_message, choices=choices, instruction=instruction_text)
-
-        # Flag to track if edit was requested
-        edit_requested = False
-
-        # Create custom key bindings
-        kb = KeyBindings()
-
-        @kb.add("e", eager=True)
-        def _(event):
-            nonlocal edit_requested
-            edit_requested = True
-            event.app.exit(result=[])
-
-        # Add our custom key bindings to the question's application
-        if not using_url:
-            # Merge our key bindings with the existing ones
-            question.application.key_bindings = merge_key_bindings([kb, question.application.key_bindings])
-
-        try:
-            selected = question.unsafe_ask()
-
-            # Check if edit was requested
-            if edit_requested and not using_url:
-                print("\nOpening mcpServers.json in editor...")
-                if edit_json_file(mcp_file_path):
-                    print("File modified. Reloading configurations...\n")
-                    # Reload the modified file
-                    available_servers = load_json_file(mcp_file_path)
-                    if not available_servers:
-                        print("\nNo MCP servers found after edit!")
-                        print("Please add server configurations to the file.")
-                        sys.exit(0)
-                else:
-                    print("No changes made to the file.\n")
-                continue  # Go back to selection
-
-        except (KeyboardInterrupt, EOFError, Exception):
-            print("\nOperation cancelled.")
-            sys.exit(0)
-
-        if selected is None:
-            print("\nOperation cancelled.")
-            sys.exit(0)
-
-        # Exit the loop if not editing
-        break
+    # Pick servers from --all/--preset, or interactively
+    interactive = not args.all and args.preset is None
+    if args.all:
+        selected = list(available_servers)
+    elif args.preset is not None:
+        selected = parse_preset(args.preset, available_servers)
+    else:
+        available_servers, selected = select_servers(available_servers, current_names, mcp_file_path)
 
     # Create new configuration
     new_servers = sync_mcp_servers(available_servers, selected)
 
     # Show changes
-    enabled_before = set(current_servers.keys())
-    enabled_after = set(new_servers.keys())
+    selected_names = frozenset(new_servers)
 
-    newly_enabled = enabled_after - enabled_before
-    newly_disabled = enabled_before - enabled_after
+    newly_enabled = sorted(selected_names - current_names)
+    newly_disabled = sorted(current_names - selected_names)
+    # Servers that stay enabled but whose configuration differs from the source
+    updated = [name for name in new_servers if name in current_names and new_servers[name] != current_servers[name]]
 
     if newly_enabled:
-        print(f"\nEnabling servers: {', '.join(sorted(newly_enabled))}")
+        print(f"\nEnabling servers: {', '.join(newly_enabled)}")
     if newly_disabled:
-        print(f"Disabling servers: {', '.join(sorted(newly_disabled))}")
+        print(f"Disabling servers: {', '.join(newly_disabled)}")
+    if updated:
+        print(f"Updating servers: {', '.join(sorted(updated))}")
 
-    if not newly_enabled and not newly_disabled:
+    # Compare whole configurations so an effectively unchanged selection never rewrites the Claude config
+    if new_servers == current_servers:
         print("\nNo changes to make.")
         return
 
-    # Confirm changes
-    try:
-        confirm = questionary.confirm("Apply these changes?").unsafe_ask()
-    except (KeyboardInterrupt, EOFError, Exception):
-        print("\nOperation cancelled.")
-        sys.exit(0)
+    # Confirm changes; --all and --preset already state the desired selection
+    if interactive:
+        import questionary
 
-    if confirm is None or not confirm:
-        print("Operation cancelled.")
-        sys.exit(0)
+        try:
+            confirm = questionary.confirm("Apply these changes?").unsafe_ask()
+        except (KeyboardInterrupt, EOFError, Exception):
+            print("\nOperation cancelled.")
+            sys.exit(0)
 
-    # Update configuration
+        if confirm is None or not confirm:
+            print("Operation cancelled.")
+            sys.exit(0)
+
+    # Load the full Claude configuration and update it
+    claude_config = load_json_file(claude_config_path)
     set_mcp_servers(claude_config, new_servers, args.project)
 
     # Save updated configuration
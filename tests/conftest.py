@@ -1,17 +1,33 @@
 """Shared pytest fixtures and configuration."""
 
-import json
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from main import _dumps, _json_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_json_cache():
+    """Start every test without files parsed and cached by load_json_file in an earlier test."""
+    _json_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def _temp_root(tmp_path_factory):
+    """Root directory shared by all temp_dir directories of a test session."""
+    return tmp_path_factory.mktemp("suite")
+
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(_temp_root):
+    """Create a temporary directory for test files.
+
+    Each test gets its own subdirectory of the session root; pytest removes old session roots itself.
+    """
+    return Path(tempfile.mkdtemp(dir=_temp_root))
 
 
 @pytest.fixture
@@ -67,8 +83,7 @@ def empty_claude_config():
 def mcp_servers_file(temp_dir, sample_mcp_servers):
     """Create a temporary mcpServers.json file."""
     filepath = temp_dir / "mcpServers.json"
-    with open(filepath, "w") as f:
-        json.dump(sample_mcp_servers, f, indent=2)
+    filepath.write_bytes(_dumps(sample_mcp_servers))
     return filepath
 
 
@@ -76,8 +91,7 @@ def mcp_servers_file(temp_dir, sample_mcp_servers):
 def claude_config_file(temp_dir, sample_claude_config):
     """Create a temporary claude.json file."""
     filepath = temp_dir / "claude.json"
-    with open(filepath, "w") as f:
-        json.dump(sample_claude_config, f, indent=2)
+    filepath.write_bytes(_dumps(sample_claude_config))
     return filepath
 
 
@@ -93,5 +107,34 @@ def mock_args():
         binding = False
         claude_config = "~/.claude.json"
         clean = False
+        preset = None
+        all = False
 
     return Args()
+
+
+@pytest.fixture
+def patched_main(monkeypatch):
+    """Replace main's file I/O and interactive selection with mocks, returned by name."""
+    mocks = {
+        "read_mcp_servers_streaming": MagicMock(return_value={}),
+        "load_json_file": MagicMock(),
+        "save_json_file": MagicMock(),
+        "select_servers": MagicMock(),
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(f"main.{name}", mock)
+    return mocks
+
+
+@pytest.fixture
+def questionary_mocks(monkeypatch):
+    """Replace questionary's checkbox and confirm prompts with mocks, returned as (checkbox, confirm).
+
+    The question objects the prompts return only expose what run_sync and clean_backup_files use.
+    """
+    checkbox = Mock(return_value=Mock(spec_set=["application", "unsafe_ask"]))
+    confirm = Mock(return_value=Mock(spec_set=["ask", "unsafe_ask"]))
+    monkeypatch.setattr("questionary.checkbox", checkbox)
+    monkeypatch.setattr("questionary.confirm", confirm)
+    return checkbox, confirm
@@ -1,127 +1,137 @@
 """Tests for CLI and argument parsing."""
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Import functions from main module
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from main import main, run_sync
+from main import _dumps, build_parser, main, run_sync, validate_args
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """The command-line parser, shared by the argument parsing tests."""
+    return build_parser()
 
 
 class TestArgumentParsing:
     """Test command line argument parsing."""
 
-    def test_default_arguments(self):
+    def test_default_arguments(self, parser):
         """Test default argument values."""
-        with patch("sys.argv", ["main.py"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.project is None
-                assert args.mcp_file == "mcpServers.json"
-                assert args.url is None
-                assert args.edit is False
-                assert args.binding is False
-                assert args.claude_config == "~/.claude.json"
-                assert args.clean is False
-
-    def test_clean_argument(self):
-        """Test --clean argument."""
-        with patch("sys.argv", ["main.py", "--clean"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.clean is True
-
-    def test_project_argument(self):
-        """Test --project argument."""
-        with patch("sys.argv", ["main.py", "--project", "/test/project"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.project == "/test/project"
-
-    def test_url_argument(self):
-        """Test --url argument."""
-        with patch("sys.argv", ["main.py", "--url", "http://example.com/mcp.json"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.url == "http://example.com/mcp.json"
-
-    def test_edit_argument(self):
-        """Test --edit argument."""
-        with patch("sys.argv", ["main.py", "--edit"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.edit is True
-
-    def test_edit_with_url_error(self, capsys):
-        """Test that --edit with --url causes error."""
-        with patch("sys.argv", ["main.py", "--edit", "--url", "http://example.com"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-            assert exc_info.value.code == 1
-
-            captured = capsys.readouterr()
-            assert "Error: --edit option cannot be used with --url" in captured.out
-
-    def test_binding_argument(self):
-        """Test --binding argument."""
-        with patch("sys.argv", ["main.py", "--binding"]):
-            with patch("main.run_sync") as mock_run:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                args = mock_run.call_args[0][0]
-                assert args.binding is True
-
-    def test_binding_with_url_error(self, capsys):
-        """Test that --binding with --url causes error."""
-        with patch("sys.argv", ["main.py", "--binding", "--url", "http://example.com"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-            assert exc_info.value.code == 1
-
-            captured = capsys.readouterr()
-            assert "Error: --binding option cannot be used with --url" in captured.out
+        args = parser.parse_args([])
+
+        assert args.project is None
+        assert args.mcp_file == "mcpServers.json"
+        assert args.url is None
+        assert args.edit is False
+        assert args.binding is False
+        assert args.claude_config == "~/.claude.json"
+        assert args.clean is False
+        assert args.preset is None
+        assert args.all is False
+        assert validate_args(args) is None
+
+    @pytest.mark.parametrize(
+        ("argv", "attr", "expected"),
+        [
+            (["--clean"], "clean", True),
+            (["--project", "/test/project"], "project", "/test/project"),
+            (["--url", "http://example.com/mcp.json"], "url", ["http://example.com/mcp.json"]),
+            (
+                ["--url", "http://a.com/1.json", "http://a.com/2.json", "-u", "http://a.com/3.json"],
+                "url",
+                ["http://a.com/1.json", "http://a.com/2.json", "http://a.com/3.json"],
+            ),
+            (["--edit"], "edit", True),
+            (["--binding"], "binding", True),
+            (["--preset", "a,b"], "preset", "a,b"),
+            (["--all"], "all", True),
+        ],
+    )
+    def test_argument(self, parser, argv, attr, expected):
+        """Test that each option is parsed."""
+        args = parser.parse_args(argv)
+
+        assert getattr(args, attr) == expected
+        assert validate_args(args) is None
+
+    @pytest.mark.parametrize(
+        ("argv", "message"),
+        [
+            (["--edit", "--url", "http://example.com"], "--edit option cannot be used with --url"),
+            (["--binding", "--url", "http://example.com"], "--binding option cannot be used with --url"),
+            (["--preset", "a", "--all"], "--preset option cannot be used with --all"),
+        ],
+    )
+    def test_incompatible_arguments(self, parser, argv, message):
+        """Test that mutually exclusive options are rejected."""
+        assert validate_args(parser.parse_args(argv)) == message
+
+    def test_main_passes_arguments_to_run_sync(self):
+        """Test that main() parses sys.argv and hands the result to run_sync."""
+        with patch("sys.argv", ["main.py", "--project", "/test/project"]), patch("main.run_sync") as mock_run:
+            main()
+
+        assert mock_run.call_args[0][0].project == "/test/project"
+
+    def test_main_rejects_incompatible_arguments(self, capsys):
+        """Test that main() reports invalid option combinations and exits."""
+        with (
+            patch("sys.argv", ["main.py", "--edit", "--url", "http://example.com"]),
+            patch("main.run_sync") as mock_run,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 1
+        mock_run.assert_not_called()
+        assert "Error: --edit option cannot be used with --url" in capsys.readouterr().out
+
+    def test_parser_is_reused(self):
+        """Test that the parser is built once and stays reusable across parses."""
+        assert build_parser() is build_parser()
+
+        assert build_parser().parse_args(["-u", "http://a.com/1.json"]).url == ["http://a.com/1.json"]
+        assert build_parser().parse_args([]).url is None
+
+
+class TestStartup:
+    """Test module startup behavior."""
+
+    def test_import_does_not_load_prompt_libraries(self):
+        """Test that importing main leaves questionary and prompt_toolkit unloaded."""
+        code = "import sys, main; print(any(m.split('.')[0] in ('questionary', 'prompt_toolkit') for m in sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+def _create_backups(fs, directory, count):
+    """Create count .claude.json backup files in the fake filesystem and return their paths."""
+    fs.create_dir(directory)
+    backups = [directory / f".claude.backup.2024010{day}_120000.json" for day in range(1, count + 1)]
+    for backup in backups:
+        fs.create_file(backup, contents='{"test": "backup"}')
+    return backups
 
 
 class TestRunSync:
     """Test run_sync function flow."""
 
+    @patch("main.read_mcp_servers_streaming")
     @patch("main.load_json_file")
     @patch("main.load_json_from_url")
-    def test_empty_mcp_servers_from_file(self, mock_load_url, mock_load_file, mock_args, capsys):
+    def test_empty_mcp_servers_from_file(self, mock_load_url, mock_load_file, mock_read_servers, mock_args, capsys):
         """Test handling of empty MCP servers from file."""
         mock_args.url = None
         mock_load_file.return_value = {}
@@ -130,6 +140,8 @@ class TestRunSync:
             run_sync(mock_args)
 
         assert exc_info.value.code == 0
+        # .claude.json is not read when there is nothing to select
+        mock_read_servers.assert_not_called()
 
         captured = capsys.readouterr()
         assert "No MCP servers found" in captured.out
@@ -139,7 +151,7 @@ class TestRunSync:
     @patch("main.load_json_from_url")
     def test_empty_mcp_servers_from_url(self, mock_load_url, mock_load_file, mock_args, capsys):
         """Test handling of empty MCP servers from URL."""
-        mock_args.url = "http://example.com/empty.json"
+        mock_args.url = ["http://example.com/empty.json"]
         mock_load_url.return_value = {}
 
         with pytest.raises(SystemExit) as exc_info:
@@ -149,11 +161,14 @@ class TestRunSync:
 
         captured = capsys.readouterr()
         assert "No MCP servers found at URL" in captured.out
-        assert mock_args.url in captured.out
+        assert mock_args.url[0] in captured.out
 
     @patch("main.edit_json_file")
+    @patch("main.read_mcp_servers_streaming", return_value={})
     @patch("main.load_json_file")
-    def test_edit_mode_file_modified(self, mock_load, mock_edit, mock_args, capsys):
+    def test_edit_mode_file_modified(
+        self, mock_load, mock_read_servers, mock_edit, questionary_mocks, mock_args, capsys
+    ):
         """Test edit mode when file is modified."""
         mock_args.edit = True
         mock_args.url = None
@@ -161,10 +176,10 @@ class TestRunSync:
         mock_load.return_value = {"server": {}}
 
         # Mock questionary to avoid interactive prompts
-        with patch("questionary.checkbox") as mock_checkbox:
-            mock_checkbox.return_value.unsafe_ask.return_value = []
+        mock_checkbox, _ = questionary_mocks
+        mock_checkbox.return_value.unsafe_ask.return_value = []
 
-            run_sync(mock_args)
+        run_sync(mock_args)
 
         captured = capsys.readouterr()
         assert "Opening" in captured.out
@@ -172,8 +187,11 @@ class TestRunSync:
         assert mock_edit.called
 
     @patch("main.edit_json_file")
+    @patch("main.read_mcp_servers_streaming", return_value={})
     @patch("main.load_json_file")
-    def test_edit_mode_file_not_modified(self, mock_load, mock_edit, mock_args, capsys):
+    def test_edit_mode_file_not_modified(
+        self, mock_load, mock_read_servers, mock_edit, questionary_mocks, mock_args, capsys
+    ):
         """Test edit mode when file is not modified."""
         mock_args.edit = True
         mock_args.url = None
@@ -181,23 +199,22 @@ class TestRunSync:
         mock_load.return_value = {"server": {}}
 
         # Mock questionary to avoid interactive prompts
-        with patch("questionary.checkbox") as mock_checkbox:
-            mock_checkbox.return_value.unsafe_ask.return_value = []
+        mock_checkbox, _ = questionary_mocks
+        mock_checkbox.return_value.unsafe_ask.return_value = []
 
-            run_sync(mock_args)
+        run_sync(mock_args)
 
         captured = capsys.readouterr()
         assert "No changes detected or edit cancelled" in captured.out
 
+    @patch("main.read_mcp_servers_streaming")
     @patch("main.load_json_file")
-    @patch("questionary.checkbox")
-    def test_no_changes_to_make(self, mock_checkbox, mock_load, mock_args, capsys):
+    def test_no_changes_to_make(self, mock_load, mock_read_servers, questionary_mocks, mock_args, capsys):
         """Test when no changes are needed."""
+        mock_checkbox, _ = questionary_mocks
         mock_args.url = None
-        mock_load.side_effect = [
-            {"server1": {}},  # MCP servers
-            {"mcpServers": {"server1": {}}},  # Claude config with same server
-        ]
+        mock_load.return_value = {"server1": {}}  # MCP servers
+        mock_read_servers.return_value = {"server1": {}}  # Claude config with same server
 
         # User selects same server that's already enabled
         mock_checkbox.return_value.unsafe_ask.return_value = ["server1"]
@@ -206,24 +223,43 @@ class TestRunSync:
 
         captured = capsys.readouterr()
         assert "No changes to make" in captured.out
+        # The full Claude config is never loaded when nothing changes
+        mock_load.assert_called_once()
+
+    def test_updated_server_config_is_synced(self, patched_main, mock_args, capsys):
+        """Test that a changed configuration is written even when the selection is unchanged."""
+        mock_args.preset = "server1"
+        patched_main["load_json_file"].side_effect = [
+            {"server1": {"type": "sse", "url": "http://new"}},  # MCP servers
+            {"mcpServers": {"server1": {"type": "sse", "url": "http://old"}}},  # Claude config
+        ]
+        patched_main["read_mcp_servers_streaming"].return_value = {"server1": {"type": "sse", "url": "http://old"}}
 
-    @patch("main.load_json_file")
-    @patch("main.save_json_file")
-    @patch("questionary.checkbox")
-    @patch("questionary.confirm")
-    def test_successful_sync(self, mock_confirm, mock_checkbox, mock_save, mock_load, mock_args, capsys):
+        run_sync(mock_args)
+
+        saved_config = patched_main["save_json_file"].call_args[0][1]
+        assert saved_config["mcpServers"] == {"server1": {"type": "sse", "url": "http://new"}}
+
+        captured = capsys.readouterr()
+        assert "Updating servers: server1" in captured.out
+        assert "No changes to make" not in captured.out
+
+    def test_successful_sync(self, patched_main, questionary_mocks, mock_args, capsys):
         """Test successful sync operation."""
+        _, mock_confirm = questionary_mocks
         mock_args.url = None
         mock_args.project = None
 
         # Setup file loading
-        mock_load.side_effect = [
-            {"server1": {"type": "sse"}, "server2": {"type": "sse"}},  # MCP servers
-            {"mcpServers": {"server1": {}}},  # Claude config
+        available = {"server1": {"type": "sse"}, "server2": {"type": "sse"}}
+        patched_main["load_json_file"].side_effect = [
+            available,  # MCP servers
+            {"mcpServers": {"server1": {}}},  # Claude config, loaded only for saving
         ]
+        patched_main["read_mcp_servers_streaming"].return_value = {"server1": {}}
 
         # User enables server2
-        mock_checkbox.return_value.unsafe_ask.return_value = ["server1", "server2"]
+        patched_main["select_servers"].return_value = (available, ["server1", "server2"])
         mock_confirm.return_value.unsafe_ask.return_value = True
 
         run_sync(mock_args)
@@ -232,17 +268,67 @@ class TestRunSync:
         assert "Syncing global MCP servers" in captured.out
         assert "Enabling servers: server2" in captured.out
         assert "Sync completed successfully!" in captured.out
-        assert mock_save.called
+        assert patched_main["save_json_file"].called
+
+    def test_preset_sync(self, patched_main, mock_args, capsys):
+        """Test that --preset applies its servers without prompting."""
+        mock_args.preset = "server2, "
+        patched_main["load_json_file"].side_effect = [
+            {"server1": {"type": "sse"}, "server2": {"type": "sse"}},  # MCP servers
+            {"mcpServers": {"server1": {}}},  # Claude config, loaded only for saving
+        ]
+        patched_main["read_mcp_servers_streaming"].return_value = {"server1": {}}
+
+        run_sync(mock_args)
+
+        patched_main["select_servers"].assert_not_called()
+        saved_config = patched_main["save_json_file"].call_args[0][1]
+        assert saved_config["mcpServers"] == {"server2": {"type": "sse"}}
+
+        captured = capsys.readouterr()
+        assert "Enabling servers: server2" in captured.out
+        assert "Disabling servers: server1" in captured.out
+        assert "Sync completed successfully!" in captured.out
+
+    @pytest.mark.parametrize(
+        ("preset", "message"),
+        [
+            ("server2,githb", "Error: Unknown server(s) in --preset: githb"),
+            ("", "Error: --preset must name at least one server"),
+            (",", "Error: --preset must name at least one server"),
+        ],
+    )
+    def test_invalid_preset_writes_nothing(self, preset, message, patched_main, mock_args, capsys):
+        """Test that a mistyped or empty --preset exits before anything is written."""
+        mock_args.preset = preset
+        patched_main["load_json_file"].return_value = {"server1": {"type": "sse"}, "server2": {"type": "sse"}}
+        patched_main["read_mcp_servers_streaming"].return_value = {"server1": {}}
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_sync(mock_args)
 
+        assert exc_info.value.code == 1
+        patched_main["save_json_file"].assert_not_called()
+        assert message in capsys.readouterr().out
+
+    def test_all_sync(self, patched_main, mock_args):
+        """Test that --all enables every available server without prompting."""
+        mock_args.all = True
+        available = {"server1": {"type": "sse"}, "server2": {"type": "sse"}}
+        patched_main["load_json_file"].side_effect = [available, {}]
+
+        run_sync(mock_args)
+
+        patched_main["select_servers"].assert_not_called()
+        assert patched_main["save_json_file"].call_args[0][1]["mcpServers"] == available
+
+    @patch("main.read_mcp_servers_streaming", return_value={})
     @patch("main.load_json_file")
-    @patch("questionary.checkbox")
-    def test_user_cancels_selection(self, mock_checkbox, mock_load, mock_args, capsys):
+    def test_user_cancels_selection(self, mock_load, mock_read_servers, questionary_mocks, mock_args, capsys):
         """Test when user cancels during selection."""
+        mock_checkbox, _ = questionary_mocks
         mock_args.url = None
-        mock_load.side_effect = [
-            {"server1": {}},  # MCP servers
-            {"mcpServers": {}},  # Claude config
-        ]
+        mock_load.return_value = {"server1": {}}  # MCP servers
 
         # User cancels (returns None)
         mock_checkbox.return_value.unsafe_ask.return_value = None
@@ -255,11 +341,11 @@ class TestRunSync:
         captured = capsys.readouterr()
         assert "Operation cancelled" in captured.out
 
-    def test_binding_mode_with_new_servers(self, capsys, mock_args, temp_dir):
+    def test_binding_mode_with_new_servers(self, capsys, mock_args, questionary_mocks, fs):
         """Test binding mode when there are new servers in .claude.json."""
         mock_args.binding = True
-        mock_args.mcp_file = str(temp_dir / "mcpServers.json")
-        mock_args.claude_config = str(temp_dir / "claude.json")
+        mock_args.mcp_file = "/work/binding-new/mcpServers.json"
+        mock_args.claude_config = "/work/binding-new/claude.json"
 
         # Create files with different servers
         mcp_servers = {"server1": {"type": "sse", "url": "http://test1"}}
@@ -270,22 +356,17 @@ class TestRunSync:
             }
         }
 
-        with open(mock_args.mcp_file, "w") as f:
-            json.dump(mcp_servers, f)
-        with open(mock_args.claude_config, "w") as f:
-            json.dump(claude_config, f)
+        fs.create_file(mock_args.mcp_file, contents=_dumps(mcp_servers))
+        fs.create_file(mock_args.claude_config, contents=_dumps(claude_config))
 
-        with patch("questionary.checkbox") as mock_checkbox:
-            mock_checkbox.return_value.unsafe_ask.return_value = ["server1", "server2"]
-
-            with patch("questionary.confirm") as mock_confirm:
-                mock_confirm.return_value.unsafe_ask.return_value = True
+        mock_checkbox, mock_confirm = questionary_mocks
+        mock_checkbox.return_value.unsafe_ask.return_value = ["server1", "server2"]
+        mock_confirm.return_value.unsafe_ask.return_value = True
 
-                run_sync(mock_args)
+        run_sync(mock_args)
 
         # Check that mcpServers.json was updated
-        with open(mock_args.mcp_file) as f:
-            updated_mcp = json.load(f)
+        updated_mcp = json.loads(fs.get_object(mock_args.mcp_file).contents)
 
         assert "server2" in updated_mcp
         assert updated_mcp["server2"]["url"] == "http://test2"
@@ -295,86 +376,78 @@ class TestRunSync:
         assert "server2" in captured.out
         assert "Added 1 server(s) to mcpServers.json" in captured.out
 
-    def test_binding_mode_no_new_servers(self, capsys, mock_args, temp_dir):
+    def test_binding_mode_no_new_servers(self, capsys, mock_args, questionary_mocks, fs):
         """Test binding mode when there are no new servers."""
         mock_args.binding = True
-        mock_args.mcp_file = str(temp_dir / "mcpServers.json")
-        mock_args.claude_config = str(temp_dir / "claude.json")
+        mock_args.mcp_file = "/work/binding-same/mcpServers.json"
+        mock_args.claude_config = "/work/binding-same/claude.json"
 
         # Create files with same servers
         servers = {"server1": {"type": "sse", "url": "http://test1"}}
 
-        with open(mock_args.mcp_file, "w") as f:
-            json.dump(servers, f)
-        with open(mock_args.claude_config, "w") as f:
-            json.dump({"mcpServers": servers}, f)
+        fs.create_file(mock_args.mcp_file, contents=_dumps(servers))
+        fs.create_file(mock_args.claude_config, contents=_dumps({"mcpServers": servers}))
 
-        with patch("questionary.checkbox") as mock_checkbox:
-            mock_checkbox.return_value.unsafe_ask.return_value = ["server1"]
-
-            with patch("questionary.confirm") as mock_confirm:
-                mock_confirm.return_value.unsafe_ask.return_value = True
+        mock_checkbox, mock_confirm = questionary_mocks
+        mock_checkbox.return_value.unsafe_ask.return_value = ["server1"]
+        mock_confirm.return_value.unsafe_ask.return_value = True
 
-                run_sync(mock_args)
+        run_sync(mock_args)
 
         captured = capsys.readouterr()
         assert "No new servers found in .claude.json to add to mcpServers.json" in captured.out
 
-    def test_clean_mode_with_backups(self, capsys, mock_args, temp_dir):
-        """Test clean mode when backup files exist."""
+    @pytest.mark.parametrize(
+        ("n_backups", "confirm", "expected", "remain"),
+        [
+            (2, True, "✓ Deleted 2 backup file(s)", False),
+            (0, None, "No backup files found.", False),
+            (1, False, "Cancelled. No files deleted.", True),
+        ],
+    )
+    def test_clean_mode(self, n_backups, confirm, expected, remain, capsys, mock_args, questionary_mocks, fs):
+        """Test clean mode with and without backups, confirming or cancelling the deletion."""
         mock_args.clean = True
-        mock_args.claude_config = str(temp_dir / ".claude.json")
-        
-        # Create some backup files
-        backup1 = temp_dir / ".claude.backup.20240101_120000.json"
-        backup2 = temp_dir / ".claude.backup.20240102_130000.json"
-        
-        backup1.write_text('{"test": "backup1"}')
-        backup2.write_text('{"test": "backup2"}')
-        
-        # Mock questionary to confirm deletion
-        with patch("questionary.confirm") as mock_confirm:
-            mock_confirm.return_value.ask.return_value = True
-            
-            run_sync(mock_args)
-        
-        # Check that backup files were deleted
-        assert not backup1.exists()
-        assert not backup2.exists()
-        
+        mock_args.claude_config = "/home/user/.claude.json"
+        backups = _create_backups(fs, Path("/home/user"), n_backups)
+
+        _, mock_confirm = questionary_mocks
+        mock_confirm.return_value.ask.return_value = confirm
+
+        run_sync(mock_args)
+
+        assert all(backup.exists() is remain for backup in backups)
+        if confirm is None:
+            mock_confirm.assert_not_called()
+
         captured = capsys.readouterr()
-        assert "Found 2 backup file(s):" in captured.out
-        assert ".claude.backup.20240101_120000.json" in captured.out
-        assert ".claude.backup.20240102_130000.json" in captured.out
-        assert "✓ Deleted 2 backup file(s)" in captured.out
+        if backups:
+            assert f"Found {n_backups} backup file(s):" in captured.out
+            assert all(backup.name in captured.out for backup in backups)
+        assert expected in captured.out
 
-    def test_clean_mode_no_backups(self, capsys, mock_args, temp_dir):
-        """Test clean mode when no backup files exist."""
+    def test_clean_mode_skips_unreadable_backups(self, capsys, mock_args, questionary_mocks, fs):
+        """Test that a dangling backup symlink does not hide the other backups."""
         mock_args.clean = True
-        mock_args.claude_config = str(temp_dir / ".claude.json")
-        
+        mock_args.claude_config = "/home/user/.claude.json"
+        (backup,) = _create_backups(fs, Path("/home/user"), 1)
+        fs.create_symlink("/home/user/.claude.backup.20240102_120000.json", "/home/user/missing.json")
+
+        _, mock_confirm = questionary_mocks
+        mock_confirm.return_value.ask.return_value = False
+
         run_sync(mock_args)
-        
+
         captured = capsys.readouterr()
-        assert "No backup files found." in captured.out
+        assert "Found 1 backup file(s):" in captured.out
+        assert backup.name in captured.out
 
-    def test_clean_mode_cancelled(self, capsys, mock_args, temp_dir):
-        """Test clean mode when user cancels deletion."""
+    def test_clean_mode_missing_directory(self, capsys, mock_args, fs):
+        """Test clean mode when the config directory does not exist."""
         mock_args.clean = True
-        mock_args.claude_config = str(temp_dir / ".claude.json")
-        
-        # Create a backup file
-        backup = temp_dir / ".claude.backup.20240101_120000.json"
-        backup.write_text('{"test": "backup"}')
-        
-        # Mock questionary to cancel deletion
-        with patch("questionary.confirm") as mock_confirm:
-            mock_confirm.return_value.ask.return_value = False
-            
-            run_sync(mock_args)
-        
-        # Check that backup file still exists
-        assert backup.exists()
-        
+        mock_args.claude_config = "/home/missing/.claude.json"
+
+        run_sync(mock_args)
+
         captured = capsys.readouterr()
-        assert "Cancelled. No files deleted." in captured.out
+        assert "No backup files found." in captured.out
@@ -1,15 +1,28 @@
 """Tests for JSON file operations."""
 
+import io
 import json
-
-# Import functions from main module
-import sys
-from pathlib import Path
+import urllib.error
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from main import load_json_file, save_json_file
+from main import (
+    _dumps,
+    load_json_file,
+    load_json_from_url,
+    load_json_from_urls,
+    save_json_file,
+)
+
+
+def make_url_response(body, headers=None):
+    """Build a mock urlopen() response usable as a context manager."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.read.return_value = body
+    response.headers = headers or {}
+    return response
 
 
 class TestLoadJsonFile:
@@ -20,8 +33,7 @@ class TestLoadJsonFile:
         # Create test file
         test_file = temp_dir / "test.json"
         test_data = {"key": "value", "number": 42}
-        with open(test_file, "w") as f:
-            json.dump(test_data, f)
+        test_file.write_bytes(_dumps(test_data))
 
         # Load and verify
         result = load_json_file(test_file)
@@ -65,10 +77,62 @@ class TestLoadJsonFile:
             load_json_file(test_file)
         assert exc_info.value.code == 1
 
+    def test_load_unchanged_file_uses_kept_parse(self, temp_dir):
+        """Test that a kept parse is handed to the next load of the unchanged file only."""
+        test_file = temp_dir / "test.json"
+        test_file.write_text('{"key": "value"}')
+
+        first = load_json_file(test_file, keep=True)
+        second = load_json_file(test_file)
+        third = load_json_file(test_file)
+
+        assert second is first
+        assert third is not first
+        assert third == first
+
+    def test_load_without_keep_does_not_cache(self, temp_dir):
+        """Test that loads are parsed afresh unless a parse was kept."""
+        test_file = temp_dir / "test.json"
+        test_file.write_text('{"key": "value"}')
+
+        assert load_json_file(test_file) is not load_json_file(test_file)
+
+    def test_load_modified_file_reparses(self, temp_dir):
+        """Test that a modified file is parsed again."""
+        test_file = temp_dir / "test.json"
+        test_file.write_text('{"key": "value"}')
+        load_json_file(test_file, keep=True)
+
+        test_file.write_text('{"key": "changed"}')
+
+        assert load_json_file(test_file) == {"key": "changed"}
+
+    def test_save_evicts_cached_file(self, temp_dir):
+        """Test that saving a file drops its cached parse."""
+        test_file = temp_dir / "test.json"
+        test_file.write_text('{"key": "value"}')
+        first = load_json_file(test_file, keep=True)
+
+        save_json_file(test_file, {"key": "saved"}, create_backup=False)
+
+        result = load_json_file(test_file)
+        assert result is not first
+        assert result == {"key": "saved"}
+
 
 class TestSaveJsonFile:
     """Test save_json_file function."""
 
+    def test_save_and_load_values_outside_orjson_range(self, temp_dir):
+        """Test that large integers and out-of-range floats survive a round trip."""
+        test_file = temp_dir / "test.json"
+        test_file.write_bytes(b'{"big": 1e400}')
+        assert load_json_file(test_file) == {"big": float("inf")}
+
+        save_json_file(test_file, {"id": 2**70}, create_backup=False)
+
+        assert json.loads(test_file.read_bytes()) == {"id": 2**70}
+
     def test_save_json_file_new(self, temp_dir, capsys):
         """Test saving to a new file."""
         test_file = temp_dir / "new.json"
@@ -91,22 +155,20 @@ class TestSaveJsonFile:
         new_data = {"new": "data"}
 
         # Create original file
-        with open(test_file, "w") as f:
-            json.dump(original_data, f)
+        test_file.write_bytes(_dumps(original_data))
 
         # Save with backup
-        save_json_file(test_file, new_data, create_backup=True)
+        backup_path = save_json_file(test_file, new_data, create_backup=True)
 
         # Verify new file contents
         with open(test_file) as f:
             assert json.load(f) == new_data
 
-        # Check backup was created
-        backup_files = list(temp_dir.glob("*.backup.*.json"))
-        assert len(backup_files) == 1
+        # Check the returned backup is the one --clean finds
+        assert list(temp_dir.glob("*.backup.*.json")) == [backup_path]
 
         # Verify backup contents
-        with open(backup_files[0]) as f:
+        with open(backup_path) as f:
             assert json.load(f) == original_data
 
         # Check output
@@ -114,6 +176,84 @@ class TestSaveJsonFile:
         assert "Created backup" in captured.out
         assert f"Updated: {test_file}" in captured.out
 
+    def test_save_json_file_backup_preserves_original_bytes(self, temp_dir):
+        """Test that the backup is a byte-for-byte copy of the original file."""
+        test_file = temp_dir / "existing.json"
+        original_content = '{"b": 1,   "a": [1, 2]}\n'
+        test_file.write_text(original_content)
+
+        backup_path = save_json_file(test_file, {"new": "data"}, create_backup=True)
+
+        assert backup_path.read_text() == original_content
+
+    def test_save_json_file_backups_in_same_second(self, temp_dir, monkeypatch):
+        """Test that saves within the same second keep every backup."""
+        monkeypatch.setattr("time.strftime", lambda fmt, t: "20240101_120000")
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"version": 1}')
+
+        first = save_json_file(test_file, {"version": 2}, create_backup=True)
+        second = save_json_file(test_file, {"version": 3}, create_backup=True)
+
+        assert first.name == "existing.backup.20240101_120000.json"
+        assert second.name == "existing.backup.20240101_120000_1.json"
+        assert json.loads(first.read_text()) == {"version": 1}
+        assert json.loads(second.read_text()) == {"version": 2}
+
+    def test_save_json_file_backup_is_previous_inode(self, temp_dir):
+        """Test that the backup keeps the previous file instead of copying it."""
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"old": "data"}')
+        original_inode = test_file.stat().st_ino
+
+        backup_path = save_json_file(test_file, {"new": "data"}, create_backup=True)
+
+        assert backup_path.stat().st_ino == original_inode
+        assert test_file.stat().st_ino != original_inode
+
+    def test_save_json_file_backup_copies_without_hard_links(self, temp_dir):
+        """Test that the backup falls back to a copy when hard links are unsupported."""
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"old": "data"}')
+
+        with patch("os.link", side_effect=PermissionError("hard links not supported")):
+            backup_path = save_json_file(test_file, {"new": "data"}, create_backup=True)
+
+        assert backup_path.read_text() == '{"old": "data"}'
+
+    def test_save_json_file_backup_copy_keeps_permissions(self, temp_dir):
+        """Test that a copied backup keeps the original file's private mode."""
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"old": "data"}')
+        test_file.chmod(0o600)
+
+        with patch("os.link", side_effect=PermissionError("hard links not supported")):
+            backup_path = save_json_file(test_file, {"new": "data"}, create_backup=True)
+
+        assert backup_path.stat().st_mode & 0o777 == 0o600
+
+    def test_save_json_file_is_atomic(self, temp_dir):
+        """Test that saving leaves no temporary file and keeps file permissions."""
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"old": "data"}')
+        test_file.chmod(0o600)
+
+        save_json_file(test_file, {"new": "data"}, create_backup=False)
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["existing.json"]
+        assert test_file.stat().st_mode & 0o777 == 0o600
+
+    def test_save_json_file_failure_keeps_original(self, temp_dir):
+        """Test that a failed save leaves the original file and no temporary file."""
+        test_file = temp_dir / "existing.json"
+        test_file.write_text('{"old": "data"}')
+
+        with patch("main._dumps", side_effect=TypeError("not serializable")), pytest.raises(TypeError):
+            save_json_file(test_file, {"new": object()}, create_backup=False)
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["existing.json"]
+        assert test_file.read_text() == '{"old": "data"}'
+
     def test_save_json_file_without_backup(self, temp_dir, capsys):
         """Test saving without backup creation."""
         test_file = temp_dir / "existing.json"
@@ -121,11 +261,10 @@ class TestSaveJsonFile:
         new_data = {"new": "data"}
 
         # Create original file
-        with open(test_file, "w") as f:
-            json.dump(original_data, f)
+        test_file.write_bytes(_dumps(original_data))
 
         # Save without backup
-        save_json_file(test_file, new_data, create_backup=False)
+        assert save_json_file(test_file, new_data, create_backup=False) is None
 
         # Verify new file contents
         with open(test_file) as f:
@@ -139,3 +278,152 @@ class TestSaveJsonFile:
         captured = capsys.readouterr()
         assert "Created backup" not in captured.out
         assert f"Updated: {test_file}" in captured.out
+
+
+class TestLoadJsonFromUrl:
+    """Test load_json_from_url function."""
+
+    URL = "http://example.com/mcpServers.json"
+
+    @pytest.fixture(autouse=True)
+    def cache_home(self, temp_dir, monkeypatch):
+        """Keep the URL cache inside the test directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+
+    def test_load_from_url(self):
+        """Test loading JSON from a URL."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b'{"server": {"type": "sse"}}')
+
+            result = load_json_from_url(self.URL)
+
+        assert result == {"server": {"type": "sse"}}
+
+    def test_not_modified_uses_cache(self, capsys):
+        """Test that a 304 response returns the cached data and sends validators."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b'{"server": {}}', {"ETag": '"abc"'})
+            load_json_from_url(self.URL)
+
+            mock_urlopen.side_effect = urllib.error.HTTPError(self.URL, 304, "Not Modified", {}, None)
+            result = load_json_from_url(self.URL)
+
+        assert result == {"server": {}}
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert "using cached copy" in capsys.readouterr().out
+
+    def test_cache_is_private(self, temp_dir):
+        """Test that cached responses, which may hold credentials, are only readable by the user."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b'{"server": {"env": {"API_KEY": "x"}}}', {"ETag": '"abc"'})
+            load_json_from_url(self.URL)
+
+        cache_dir = temp_dir / "mcp-sync-config"
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        cache_files = list(cache_dir.iterdir())
+        assert len(cache_files) == 1
+        assert cache_files[0].suffix == ".json"
+        assert cache_files[0].stat().st_mode & 0o777 == 0o600
+
+    def test_cache_is_compact(self, temp_dir):
+        """Test that cached responses are written without indentation."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b'{"server": {"type": "sse"}}', {"ETag": '"abc"'})
+            load_json_from_url(self.URL)
+
+        (cache_file,) = (temp_dir / "mcp-sync-config").iterdir()
+        assert b"\n" not in cache_file.read_bytes()
+
+    def test_no_validators_sends_unconditional_request(self):
+        """Test that responses without ETag or Last-Modified are not cached."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b'{"server": {}}')
+            load_json_from_url(self.URL)
+            load_json_from_url(self.URL)
+
+        request = mock_urlopen.call_args[0][0]
+        assert not request.has_header("If-none-match")
+
+    def test_large_response_is_stream_parsed(self, monkeypatch):
+        """Test that responses above the size threshold are parsed incrementally."""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("main._STREAM_PARSE_MIN_BYTES", 8)
+        body = b'{"server": {"type": "sse", "timeout": 1.5}}'
+        response = io.BytesIO(body)
+        response.headers = {"Content-Length": str(len(body))}
+
+        with patch("urllib.request.urlopen", return_value=response):
+            result = load_json_from_url(self.URL)
+
+        assert result == {"server": {"type": "sse", "timeout": 1.5}}
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_non_object_response(self, monkeypatch, capsys, stream):
+        """Test that a top-level value other than an object is rejected with or without streaming."""
+        if stream:
+            pytest.importorskip("ijson")
+            monkeypatch.setattr("main._STREAM_PARSE_MIN_BYTES", 4)
+        body = b'[{"type": "sse"}]'
+        response = io.BytesIO(body)
+        response.headers = {"Content-Length": str(len(body))}
+
+        with patch("urllib.request.urlopen", return_value=response), pytest.raises(SystemExit) as exc_info:
+            load_json_from_url(self.URL)
+
+        assert exc_info.value.code == 1
+        assert "expected an object" in capsys.readouterr().out
+
+    def test_http_error(self, capsys):
+        """Test that HTTP errors exit with an error message."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.side_effect = urllib.error.HTTPError(self.URL, 404, "Not Found", {}, None)
+
+            with pytest.raises(SystemExit) as exc_info:
+                load_json_from_url(self.URL)
+
+        assert exc_info.value.code == 1
+        assert "Error fetching URL" in capsys.readouterr().out
+
+    def test_invalid_json_from_url(self):
+        """Test that invalid JSON from a URL exits with an error."""
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value = make_url_response(b"{ invalid json }")
+
+            with pytest.raises(SystemExit) as exc_info:
+                load_json_from_url(self.URL)
+
+        assert exc_info.value.code == 1
+
+
+class TestLoadJsonFromUrls:
+    """Test load_json_from_urls function."""
+
+    def test_single_url(self):
+        """Test that a single URL is loaded directly."""
+        with patch("main.load_json_from_url", return_value={"server": {}}) as mock_load:
+            result = load_json_from_urls(["http://a.com/1.json"])
+
+        assert result == {"server": {}}
+        mock_load.assert_called_once_with("http://a.com/1.json")
+
+    def test_multiple_urls_merged_in_order(self):
+        """Test that later URLs take precedence when merging."""
+        responses = {
+            "http://a.com/1.json": {"shared": {"url": "first"}, "only-first": {}},
+            "http://a.com/2.json": {"shared": {"url": "second"}, "only-second": {}},
+        }
+        with patch("main.load_json_from_url", side_effect=responses.get):
+            result = load_json_from_urls(list(responses))
+
+        assert result == {"shared": {"url": "second"}, "only-first": {}, "only-second": {}}
+
+    def test_failing_url_exits(self):
+        """Test that a failing URL aborts the whole load."""
+        with (
+            patch("main.load_json_from_url", side_effect=[{}, SystemExit(1)]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            load_json_from_urls(["http://a.com/1.json", "http://a.com/2.json"])
+
+        assert exc_info.value.code == 1
@@ -1,11 +1,15 @@
 """Tests for MCP server operations."""
 
-# Import functions from main module
-import sys
-from pathlib import Path
+import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from main import create_server_choices, get_current_mcp_servers, set_mcp_servers, sync_mcp_servers
+from main import (
+    _build_raw_choices,
+    create_server_choices,
+    get_current_mcp_servers,
+    read_mcp_servers_streaming,
+    set_mcp_servers,
+    sync_mcp_servers,
+)
 
 
 class TestGetCurrentMcpServers:
@@ -17,6 +21,14 @@ class TestGetCurrentMcpServers:
 
         assert result == {"test-server-1": {"type": "sse", "url": "http://localhost:8001/mcp/sse"}}
 
+    def test_get_mcp_servers_is_read_only(self, sample_claude_config):
+        """Test that the returned servers cannot be modified in place."""
+        result = get_current_mcp_servers(sample_claude_config, project_path=None)
+
+        with pytest.raises(TypeError):
+            result["new-server"] = {}
+        assert "new-server" not in sample_claude_config["mcpServers"]
+
     def test_get_project_mcp_servers(self, sample_claude_config):
         """Test getting project-specific MCP servers."""
         result = get_current_mcp_servers(sample_claude_config, project_path="/home/test/project1")
@@ -36,6 +48,51 @@ class TestGetCurrentMcpServers:
         assert result == {}
 
 
+class TestReadMcpServersStreaming:
+    """Test read_mcp_servers_streaming function."""
+
+    def test_read_global_mcp_servers(self, claude_config_file, sample_claude_config):
+        """Test reading global MCP servers."""
+        result = read_mcp_servers_streaming(claude_config_file)
+
+        assert result == sample_claude_config["mcpServers"]
+
+    def test_read_project_mcp_servers(self, claude_config_file, sample_claude_config):
+        """Test reading project-specific MCP servers."""
+        result = read_mcp_servers_streaming(claude_config_file, project_path="/home/test/project1")
+
+        assert result == sample_claude_config["projects"]["/home/test/project1"]["mcpServers"]
+
+    def test_read_missing_project(self, claude_config_file):
+        """Test reading MCP servers for non-existent project."""
+        result = read_mcp_servers_streaming(claude_config_file, project_path="/home/test/missing")
+
+        assert result == {}
+
+    def test_read_project_path_with_dot(self, temp_dir):
+        """Test reading a project whose path contains a dot."""
+        config_file = temp_dir / "claude.json"
+        config_file.write_text('{"projects": {"/home/test/my.app": {"mcpServers": {"server": {}}}}}')
+
+        result = read_mcp_servers_streaming(config_file, project_path="/home/test/my.app")
+
+        assert result == {"server": {}}
+
+    def test_read_without_ijson(self, claude_config_file, sample_claude_config, monkeypatch):
+        """Test falling back to a full load when ijson is not installed."""
+        monkeypatch.setattr("main.ijson", None)
+
+        result = read_mcp_servers_streaming(claude_config_file, project_path="/home/test/project1")
+
+        assert result == sample_claude_config["projects"]["/home/test/project1"]["mcpServers"]
+
+    def test_read_missing_file(self, temp_dir):
+        """Test reading from a missing file."""
+        with pytest.raises(SystemExit) as exc_info:
+            read_mcp_servers_streaming(temp_dir / "missing.json")
+        assert exc_info.value.code == 1
+
+
 class TestSetMcpServers:
     """Test set_mcp_servers function."""
 
@@ -76,6 +133,16 @@ class TestSetMcpServers:
         assert project_config["history"] == []
         assert project_config["hasTrustDialogAccepted"] is False
 
+    def test_set_new_projects_do_not_share_lists(self):
+        """Test that separately created projects get their own list fields."""
+        config = {}
+
+        set_mcp_servers(config, {}, project_path="/home/test/a")
+        set_mcp_servers(config, {}, project_path="/home/test/b")
+        config["projects"]["/home/test/a"]["allowedTools"].append("Bash")
+
+        assert config["projects"]["/home/test/b"]["allowedTools"] == []
+
     def test_set_mcp_servers_empty_config(self):
         """Test setting MCP servers in empty config."""
         config = {}
@@ -93,7 +160,7 @@ class TestCreateServerChoices:
         """Test creating choices with SSE and command servers."""
         current_servers = {"test-server-1": {}}
 
-        choices = create_server_choices(sample_mcp_servers, current_servers)
+        choices = create_server_choices(sample_mcp_servers, frozenset(current_servers))
 
         # Check number of choices
         assert len(choices) == 3
@@ -113,14 +180,14 @@ class TestCreateServerChoices:
 
     def test_create_choices_all_enabled(self, sample_mcp_servers):
         """Test creating choices when all servers are enabled."""
-        choices = create_server_choices(sample_mcp_servers, sample_mcp_servers)
+        choices = create_server_choices(sample_mcp_servers, frozenset(sample_mcp_servers))
 
         for choice in choices:
             assert choice.checked is True
 
     def test_create_choices_none_enabled(self, sample_mcp_servers):
         """Test creating choices when no servers are enabled."""
-        choices = create_server_choices(sample_mcp_servers, {})
+        choices = create_server_choices(sample_mcp_servers, frozenset())
 
         for choice in choices:
             assert choice.checked is False
@@ -128,50 +195,62 @@ class TestCreateServerChoices:
     def test_create_choices_unknown_server_type(self):
         """Test creating choices with unknown server type."""
         servers = {"unknown": {"something": "else"}}
-        choices = create_server_choices(servers, {})
+        choices = create_server_choices(servers, frozenset())
 
         assert len(choices) == 1
         assert choices[0].title == "unknown"
         assert choices[0].value == "unknown"
 
+    def test_build_raw_choices(self, sample_mcp_servers):
+        """Test building the sorted menu entries without questionary."""
+        rows = _build_raw_choices(sample_mcp_servers, frozenset({"test-postgres"}))
 
-class TestSyncMcpServers:
-    """Test sync_mcp_servers function."""
-
-    def test_sync_selected_servers(self, sample_mcp_servers):
-        """Test syncing selected servers."""
-        selected = ["test-server-1", "test-postgres"]
-
-        result = sync_mcp_servers(sample_mcp_servers, selected)
-
-        assert len(result) == 2
-        assert "test-server-1" in result
-        assert "test-postgres" in result
-        assert "test-server-2" not in result
+        assert rows == [
+            ("test-postgres (Command: docker)", "test-postgres", True),
+            ("test-server-1 (SSE: http://localhost:8001/mcp/sse)", "test-server-1", False),
+            ("test-server-2 (SSE: http://localhost:8002/mcp/sse)", "test-server-2", False),
+        ]
+        assert rows[0].value == "test-postgres"
 
-        # Verify full server configs are copied
-        assert result["test-server-1"] == sample_mcp_servers["test-server-1"]
-        assert result["test-postgres"] == sample_mcp_servers["test-postgres"]
+    def test_create_choices_malformed_type(self):
+        """Test that a non-string server type falls back to the command label."""
+        servers = {"odd": {"type": ["sse"], "command": "run"}}
 
-    def test_sync_no_servers_selected(self, sample_mcp_servers):
-        """Test syncing with no servers selected."""
-        result = sync_mcp_servers(sample_mcp_servers, [])
-        assert result == {}
+        choices = create_server_choices(servers, frozenset())
 
-    def test_sync_nonexistent_server(self, sample_mcp_servers):
-        """Test syncing with non-existent server in selection."""
-        selected = ["test-server-1", "non-existent"]
+        assert choices[0].title == "odd (Command: run)"
 
-        result = sync_mcp_servers(sample_mcp_servers, selected)
 
-        assert len(result) == 1
-        assert "test-server-1" in result
-        assert "non-existent" not in result
+@pytest.fixture(scope="module")
+def shared_mcp_servers():
+    """Servers shared by the sync tests; sync_mcp_servers never mutates its input."""
+    return {
+        "test-server-1": {"type": "sse", "url": "http://localhost:8001/mcp/sse"},
+        "test-server-2": {"type": "sse", "url": "http://localhost:8002/mcp/sse"},
+        "test-postgres": {"command": "docker", "args": ["run", "-i", "--rm", "postgres-mcp"]},
+    }
 
-    def test_sync_all_servers(self, sample_mcp_servers):
-        """Test syncing all available servers."""
-        selected = list(sample_mcp_servers.keys())
 
-        result = sync_mcp_servers(sample_mcp_servers, selected)
+class TestSyncMcpServers:
+    """Test sync_mcp_servers function."""
 
-        assert result == sample_mcp_servers
+    @pytest.mark.parametrize(
+        ("selected", "expected"),
+        [
+            pytest.param(["test-server-1", "test-postgres"], ["test-server-1", "test-postgres"], id="selected"),
+            pytest.param(["test-postgres", "test-server-1"], ["test-server-1", "test-postgres"], id="source-order"),
+            pytest.param([], [], id="none"),
+            pytest.param(["test-server-1", "non-existent"], ["test-server-1"], id="nonexistent"),
+            pytest.param(
+                ["test-server-1", "test-server-2", "test-postgres"],
+                ["test-server-1", "test-server-2", "test-postgres"],
+                id="all",
+            ),
+        ],
+    )
+    def test_sync_servers(self, shared_mcp_servers, selected, expected):
+        """Test that the selected servers are kept in source order, sharing their configs."""
+        result = sync_mcp_servers(shared_mcp_servers, selected)
+
+        assert list(result) == expected
+        assert all(result[name] is shared_mcp_servers[name] for name in expected)